@@ -24,6 +24,12 @@ retriever = load_system()
 if retriever:
     st.sidebar.header("System Status")
     st.sidebar.success("RAG System Loaded Successfully")
+    st.sidebar.write(f"Index version: {retriever.index_version or 'legacy'}")
+    if st.sidebar.button("Rebuild Index"):
+        if retriever.indexer.build_index_in_background():
+            st.sidebar.info("Index rebuild started in the background. The new index will be swapped in once ready.")
+        else:
+            st.sidebar.warning("An index rebuild is already in progress.")
 
     # Query interface
     st.header("Ask Questions")
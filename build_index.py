@@ -14,7 +14,7 @@ def main():
     print("Building vector index...")
     indexer = Indexer()
     vectorstore = indexer.build_index()
-    print(f"Index built successfully! Saved to {indexer.config.VECTOR_DB_PATH}")
+    print(f"Index built successfully! Saved to {indexer.versions.path_for(indexer.versions.current_version())}")
     print(f"Indexed {vectorstore.index.ntotal} documents.")
 
 if __name__ == "__main__":
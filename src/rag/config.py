@@ -7,8 +7,15 @@ class Config:
     GROQ_API_KEY = os.getenv("GROQ_API_KEY")
     DATA_DIR = "data/documents"
     VECTOR_DB_PATH = "data/vectorstore"
+    INDEX_VERSIONS_TO_KEEP = 2  # Older index versions are garbage-collected
+    INDEX_RELOAD_INTERVAL = 30  # Seconds between checks for a new index version
     CHUNK_SIZE = 1000
     CHUNK_OVERLAP = 0
+    DEDUP_ENABLED = True  # Drop near-duplicate chunks before embedding
+    DEDUP_THRESHOLD = 0.85  # Estimated Jaccard similarity above which chunks are duplicates
+    DEDUP_NUM_PERM = 128  # MinHash signature length
+    DEDUP_BANDS = 32  # LSH bands (DEDUP_NUM_PERM must be divisible by this)
+    DEDUP_SHINGLE_SIZE = 5  # Words per shingle
     EMBEDDING_MODEL = "all-MiniLM-L6-v2"  # SentenceTransformer model
     LLM_MODEL = "llama-3.1-8b-instant"
     BASE_URL = "https://api.groq.com/openai/v1"
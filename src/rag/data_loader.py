@@ -1,6 +1,7 @@
 from langchain_community.document_loaders import DirectoryLoader, TextLoader, PyMuPDFLoader
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from .config import Config
+from .deduplicator import Deduplicator
 from typing import List
 import logging
 
@@ -16,12 +17,20 @@ class DataLoader:
             chunk_size=self.config.CHUNK_SIZE,
             chunk_overlap=self.config.CHUNK_OVERLAP
         )
+        self.deduplicator = Deduplicator() if self.config.DEDUP_ENABLED else None
+
+    def _split_and_deduplicate(self, documents: List) -> List:
+        """Split documents into chunks and drop near-duplicate chunks."""
+        chunks = self.text_splitter.split_documents(documents)
+        if self.deduplicator:
+            chunks = self.deduplicator.deduplicate(chunks)
+        return chunks
 
     def load_documents(self) -> List:
         """Load all documents from the data directory.
 
         Returns:
-            List of split documents.
+            List of split, deduplicated documents.
         """
         try:
             # Load PDFs
@@ -42,7 +51,7 @@ class DataLoader:
 
             documents = pdf_documents + text_documents
             logger.info(f"Loaded {len(pdf_documents)} PDFs and {len(text_documents)} text files.")
-            return self.text_splitter.split_documents(documents)
+            return self._split_and_deduplicate(documents)
         except Exception as e:
             logger.error(f"Error loading documents: {e}")
             return []
@@ -51,7 +60,7 @@ class DataLoader:
         """Load PDF documents.
 
         Returns:
-            List of split PDF documents.
+            List of split, deduplicated PDF documents.
         """
         # For simplicity, assuming PDFs in data/pdfs
         try:
@@ -61,7 +70,7 @@ class DataLoader:
                 loader_cls=PyMuPDFLoader
             )
             documents = pdf_loader.load()
-            return self.text_splitter.split_documents(documents)
+            return self._split_and_deduplicate(documents)
         except Exception as e:
             logger.error(f"Error loading PDF documents: {e}")
             return []
\ No newline at end of file
@@ -0,0 +1,119 @@
+from .config import Config
+from typing import Dict, List, Optional
+import hashlib
+import logging
+import re
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+class Deduplicator:
+    """Near-duplicate chunk detection using MinHash and LSH banding."""
+
+    def __init__(self) -> None:
+        """Initialize the Deduplicator with MinHash permutations."""
+        self.config = Config()
+        self.threshold = self.config.DEDUP_THRESHOLD
+        self.num_perm = self.config.DEDUP_NUM_PERM
+        self.bands = self.config.DEDUP_BANDS
+        self.shingle_size = self.config.DEDUP_SHINGLE_SIZE
+        if self.num_perm % self.bands:
+            raise ValueError("DEDUP_NUM_PERM must be divisible by DEDUP_BANDS.")
+        self.rows = self.num_perm // self.bands
+        # Fixed seed so signatures are stable across runs. Coefficients and
+        # shingle hashes stay below 2**32 so a * s + b cannot overflow uint64.
+        rng = np.random.default_rng(1)
+        self.perm_a = rng.integers(1, 1 << 32, size=(self.num_perm, 1), dtype=np.uint64)
+        self.perm_b = rng.integers(0, 1 << 32, size=(self.num_perm, 1), dtype=np.uint64)
+        self.removed_count = 0  # Near-duplicate chunks dropped by the last run
+        self.empty_count = 0  # Chunks without words dropped by the last run
+
+    def _shingles(self, text: str) -> np.ndarray:
+        """Hash the word shingles of a normalized text.
+
+        Returns:
+            Array of unique shingle hashes, empty if the text has no words.
+        """
+        words = re.sub(r"\W+", " ", text.lower()).split()
+        if not words:
+            return np.empty(0, dtype=np.uint64)
+        if len(words) <= self.shingle_size:
+            grams = {" ".join(words)}
+        else:
+            grams = {" ".join(words[i:i + self.shingle_size]) for i in range(len(words) - self.shingle_size + 1)}
+        return np.fromiter(
+            (int.from_bytes(hashlib.blake2b(gram.encode("utf-8"), digest_size=4).digest(), "little") for gram in grams),
+            dtype=np.uint64,
+            count=len(grams)
+        )
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """Compute the MinHash signature of a text.
+
+        Args:
+            text: The text to sign.
+
+        Returns:
+            Array of ``num_perm`` minimum hash values, or None if the text has no words.
+        """
+        shingles = self._shingles(text)
+        if not shingles.size:
+            return None
+        hashes = (self.perm_a * shingles + self.perm_b) % _MERSENNE_PRIME & _MAX_HASH
+        return hashes.min(axis=1)
+
+    @staticmethod
+    def similarity(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+        """Estimate the Jaccard similarity of two signatures."""
+        return float(np.mean(sig_a == sig_b))
+
+    def deduplicate(self, documents: List) -> List:
+        """Collapse near-duplicate documents, keeping the first occurrence.
+
+        Sources of dropped duplicates are recorded in the kept document's
+        ``duplicate_sources`` metadata. Chunks without any words (empty, or only
+        punctuation such as separator lines) are dropped as well.
+
+        Args:
+            documents: List of documents to deduplicate.
+
+        Returns:
+            List of unique documents, in their original order.
+        """
+        buckets: Dict[tuple, List[int]] = {}
+        signatures: List[np.ndarray] = []
+        kept = []
+        empty_count = 0
+        for doc in documents:
+            sig = self.signature(doc.page_content)
+            if sig is None:
+                empty_count += 1
+                continue
+            bands = [(i, sig[i:i + self.rows].tobytes()) for i in range(0, self.num_perm, self.rows)]
+            candidates = {idx for band in bands for idx in buckets.get(band, [])}
+            match = next(
+                (idx for idx in sorted(candidates) if self.similarity(sig, signatures[idx]) >= self.threshold),
+                None
+            )
+            if match is not None:
+                original = kept[match]
+                source = doc.metadata.get('source')
+                if source and source != original.metadata.get('source'):
+                    duplicate_sources = original.metadata.setdefault('duplicate_sources', [])
+                    if source not in duplicate_sources:
+                        duplicate_sources.append(source)
+                continue
+            for band in bands:
+                buckets.setdefault(band, []).append(len(kept))
+            signatures.append(sig)
+            kept.append(doc)
+        self.empty_count = empty_count
+        self.removed_count = len(documents) - len(kept) - empty_count
+        logger.info(
+            f"Removed {self.removed_count} near-duplicate and {self.empty_count} empty chunks "
+            f"out of {len(documents)}."
+        )
+        return kept
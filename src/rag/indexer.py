@@ -2,21 +2,194 @@ from langchain_community.embeddings import SentenceTransformerEmbeddings
 from langchain_community.vectorstores import FAISS
 from .config import Config
 from .data_loader import DataLoader
-from typing import List
+from typing import List, Optional, Tuple
 import logging
+import os
+import shutil
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+class IndexVersions:
+    """Versioned index directories behind an atomically updated "current" pointer.
+
+    Each build is written to its own directory under ``<root>/versions`` and only
+    becomes visible once the ``CURRENT`` pointer file is replaced, so readers never
+    see a half-written index.
+    """
+
+    POINTER_FILE = "CURRENT"
+    VERSIONS_DIR = "versions"
+    STAGING_PREFIX = ".staging-"
+    LEGACY_FILES = ("index.faiss", "index.pkl")
+    STALE_STAGING_AGE = 3600  # Seconds before another process's staging dir counts as abandoned
+
+    def __init__(self, root: str, keep: int = 2) -> None:
+        """Initialize the version manager.
+
+        Args:
+            root: Root directory of the vector store.
+            keep: Number of most recent versions to keep on cleanup.
+        """
+        self.root = root
+        self.keep = max(1, keep)
+        self.versions_dir = os.path.join(root, self.VERSIONS_DIR)
+        self.pointer_path = os.path.join(root, self.POINTER_FILE)
+        self._active_staging = set()
+
+    def current_version(self) -> Optional[str]:
+        """Return the name of the current version, or None if none was published."""
+        try:
+            with open(self.pointer_path, 'r') as f:
+                version = f.read().strip()
+            return version or None
+        except FileNotFoundError:
+            return None
+
+    def path_for(self, version: Optional[str]) -> str:
+        """Return the directory of a version.
+
+        Falls back to the root directory when no version is given, which keeps
+        indexes built before versioning loadable.
+        """
+        if not version:
+            return self.root
+        return os.path.join(self.versions_dir, version)
+
+    def stage(self) -> Tuple[str, str]:
+        """Create a staging directory for a new version.
+
+        Returns:
+            Tuple of (version name, staging directory).
+        """
+        version = f"v{time.time_ns()}"
+        staging_path = os.path.join(self.versions_dir, f"{self.STAGING_PREFIX}{version}")
+        os.makedirs(staging_path)
+        self._active_staging.add(staging_path)
+        return version, staging_path
+
+    def discard(self, staging_path: str) -> None:
+        """Remove a staging directory whose build failed."""
+        self._active_staging.discard(staging_path)
+        shutil.rmtree(staging_path, ignore_errors=True)
+
+    def publish(self, version: str, staging_path: str) -> str:
+        """Move a staged version into place and point ``CURRENT`` at it.
+
+        The version directory is removed again if the pointer cannot be
+        updated, so an unpublished build is never kept as a recent version.
+
+        Args:
+            version: Version name returned by ``stage``.
+            staging_path: Staging directory returned by ``stage``.
+
+        Returns:
+            The directory of the published version.
+        """
+        version_path = self.path_for(version)
+        os.rename(staging_path, version_path)
+        self._active_staging.discard(staging_path)
+        # Per-version temp file so concurrent publishers never share it
+        tmp_pointer = f"{self.pointer_path}.{version}.tmp"
+        try:
+            with open(tmp_pointer, 'w') as f:
+                f.write(version)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_pointer, self.pointer_path)
+        except Exception:
+            if os.path.exists(tmp_pointer):
+                os.remove(tmp_pointer)
+            shutil.rmtree(version_path, ignore_errors=True)
+            raise
+        return version_path
+
+    def list_versions(self) -> List[str]:
+        """List published versions, oldest first."""
+        if not os.path.isdir(self.versions_dir):
+            return []
+        return sorted(
+            name for name in os.listdir(self.versions_dir)
+            if not name.startswith(".") and os.path.isdir(os.path.join(self.versions_dir, name))
+        )
+
+    def _remove_stale_staging(self) -> None:
+        """Remove staging directories left behind by crashed or killed builds.
+
+        Builds still running in this process are skipped, as are recently
+        modified directories that may belong to a build in another process.
+        """
+        if not os.path.isdir(self.versions_dir):
+            return
+        now = time.time()
+        for name in os.listdir(self.versions_dir):
+            path = os.path.join(self.versions_dir, name)
+            if not name.startswith(self.STAGING_PREFIX) or path in self._active_staging:
+                continue
+            try:
+                if now - os.path.getmtime(path) < self.STALE_STAGING_AGE:
+                    continue
+                shutil.rmtree(path)
+                logger.info(f"Removed stale staging directory {name}.")
+            except OSError as e:
+                logger.warning(f"Failed to remove staging directory {name}: {e}")
+
+    def _remove_legacy_index(self) -> None:
+        """Remove the unversioned index in the root once a version is published."""
+        for name in self.LEGACY_FILES:
+            path = os.path.join(self.root, name)
+            if not os.path.exists(path):
+                continue
+            try:
+                os.remove(path)
+                logger.info(f"Removed legacy index file {name}.")
+            except OSError as e:
+                logger.warning(f"Failed to remove legacy index file {name}: {e}")
+
+    def cleanup(self) -> List[str]:
+        """Remove old versions, keeping the most recent ones and the current one.
+
+        Stale staging directories are removed too, as is the legacy unversioned
+        index once a version has been published.
+
+        Returns:
+            Names of the removed versions.
+        """
+        self._remove_stale_staging()
+        current = self.current_version()
+        if current:
+            self._remove_legacy_index()
+        versions = self.list_versions()
+        keep = set(versions[-self.keep:])
+        if current:
+            keep.add(current)
+        removed = []
+        for version in versions:
+            if version in keep:
+                continue
+            try:
+                shutil.rmtree(self.path_for(version))
+                removed.append(version)
+            except OSError as e:
+                logger.warning(f"Failed to remove old index version {version}: {e}")
+        if removed:
+            logger.info(f"Removed {len(removed)} old index version(s).")
+        return removed
+
 class Indexer:
     """Indexer class for creating and loading FAISS vector stores."""
 
+    _build_lock = threading.Lock()
+
     def __init__(self) -> None:
         """Initialize the Indexer with embeddings."""
         self.config = Config()
         self.embeddings = SentenceTransformerEmbeddings(model_name=self.config.EMBEDDING_MODEL)
+        self.versions = IndexVersions(self.config.VECTOR_DB_PATH, self.config.INDEX_VERSIONS_TO_KEEP)
 
     def create_index(self, documents: List) -> FAISS:
-        """Create and save FAISS index from documents.
+        """Create and save FAISS index from documents as a new version.
 
         Args:
             documents: List of documents to index.
@@ -25,23 +198,34 @@ class Indexer:
             The created FAISS vectorstore.
         """
         vectorstore = FAISS.from_documents(documents, self.embeddings)
-        vectorstore.save_local(self.config.VECTOR_DB_PATH)
-        logger.info(f"Index saved to {self.config.VECTOR_DB_PATH}")
+        version, staging_path = self.versions.stage()
+        try:
+            vectorstore.save_local(staging_path)
+            version_path = self.versions.publish(version, staging_path)
+        except Exception:
+            self.versions.discard(staging_path)
+            raise
+        logger.info(f"Index saved to {version_path}")
+        self.versions.cleanup()
         return vectorstore
 
-    def load_index(self) -> FAISS:
+    def load_index(self, version: Optional[str] = None) -> FAISS:
         """Load existing FAISS index.
 
+        Args:
+            version: Version to load. Defaults to the current version.
+
         Returns:
             The loaded FAISS vectorstore.
         """
+        path = self.versions.path_for(version or self.versions.current_version())
         try:
             vectorstore = FAISS.load_local(
-                self.config.VECTOR_DB_PATH,
+                path,
                 self.embeddings,
                 allow_dangerous_deserialization=True
             )
-            logger.info("Index loaded successfully.")
+            logger.info(f"Index loaded successfully from {path}.")
             return vectorstore
         except Exception as e:
             logger.error(f"Failed to load index: {e}")
@@ -56,4 +240,28 @@ class Indexer:
         loader = DataLoader()
         docs = loader.load_documents()
         logger.info(f"Loaded {len(docs)} documents.")
-        return self.create_index(docs)
\ No newline at end of file
+        return self.create_index(docs)
+
+    def build_index_in_background(self) -> Optional[threading.Thread]:
+        """Rebuild the index in a background thread.
+
+        Running retrievers pick up the new version once it is published.
+
+        Returns:
+            The started thread, or None if a rebuild is already running.
+        """
+        if not self._build_lock.acquire(blocking=False):
+            logger.info("Index rebuild already in progress.")
+            return None
+
+        def run() -> None:
+            try:
+                self.build_index()
+            except Exception as e:
+                logger.error(f"Background index rebuild failed: {e}")
+            finally:
+                self._build_lock.release()
+
+        thread = threading.Thread(target=run, name="index-rebuild", daemon=True)
+        thread.start()
+        return thread
@@ -3,14 +3,22 @@ from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage
 from .config import Config
 from .indexer import Indexer
-from .data_loader import DataLoader
 import logging
-from typing import List
+import threading
+import time
+from typing import Any, List, NamedTuple, Optional
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class IndexState(NamedTuple):
+    """Index-dependent retriever state, published as a single unit on swap."""
+    vectorstore: Any
+    retriever: Any
+    bm25_retriever: Optional[BM25Retriever]
+    version: Optional[str]
+
 class Retriever:
     """Retriever class for RAG system using vector search and LLM."""
 
@@ -19,9 +27,9 @@ class Retriever:
         self.config = Config()
         self.config.validate()  # Validate configuration
         self.indexer = Indexer()
-        self.data_loader = DataLoader()
         try:
-            self.vectorstore = self.indexer.load_index()
+            version = self.indexer.versions.current_version()
+            vectorstore = self.indexer.load_index(version)
             logger.info("Vectorstore loaded successfully.")
         except Exception as e:
             logger.error(f"Failed to load vectorstore: {e}")
@@ -32,26 +40,117 @@ class Retriever:
             base_url=self.config.BASE_URL,
             temperature=0  # Reduce creativity
         )
-        self.retriever = self.vectorstore.as_retriever(search_kwargs={"k": 3})
         # Initialize BM25 for hybrid search
-        self.bm25_retriever = None
-        self._init_bm25()
-
-    def _init_bm25(self) -> None:
-        """Initialize BM25 retriever for hybrid search."""
         try:
-            docs = self.data_loader.load_documents()
-            if docs:
-                self.bm25_retriever = BM25Retriever.from_documents(docs)
-                self.bm25_retriever.k = 3
-                logger.info("BM25 retriever initialized.")
+            bm25_retriever = self._build_bm25(vectorstore)
         except Exception as e:
             logger.warning(f"Failed to initialize BM25: {e}")
+            bm25_retriever = None
+        self._state = IndexState(
+            vectorstore,
+            vectorstore.as_retriever(search_kwargs={"k": 3}),
+            bm25_retriever,
+            version
+        )
+        # Hot-swap state for picking up new index versions
+        self._reload_lock = threading.Lock()
+        self._reloading = False
+        self._failed_version = None
+        self._last_reload_check = time.monotonic()
+
+    @property
+    def vectorstore(self) -> Any:
+        """The FAISS vectorstore currently in use."""
+        return self._state.vectorstore
+
+    @property
+    def retriever(self) -> Any:
+        """The vector retriever currently in use."""
+        return self._state.retriever
+
+    @property
+    def bm25_retriever(self) -> Optional[BM25Retriever]:
+        """The BM25 retriever currently in use, if any."""
+        return self._state.bm25_retriever
+
+    @property
+    def index_version(self) -> Optional[str]:
+        """The index version currently in use, or None for a legacy index."""
+        return self._state.version
+
+    @staticmethod
+    def _build_bm25(vectorstore: Any) -> Optional[BM25Retriever]:
+        """Build a BM25 retriever over the chunks stored in a vectorstore.
+
+        Returns:
+            The BM25 retriever, or None if the vectorstore holds no documents.
+        """
+        docs = [
+            vectorstore.docstore.search(doc_id)
+            for doc_id in vectorstore.index_to_docstore_id.values()
+        ]
+        if not docs:
+            return None
+        bm25_retriever = BM25Retriever.from_documents(docs)
+        bm25_retriever.k = 3
+        logger.info("BM25 retriever initialized.")
+        return bm25_retriever
+
+    def check_for_new_index(self, force: bool = False) -> None:
+        """Start a background swap if a new index version has been published.
+
+        Checks are throttled by ``INDEX_RELOAD_INTERVAL`` unless ``force`` is set.
+        Queries keep using the current index until the new one is fully loaded.
+        A version that failed to load is not retried until ``CURRENT`` changes.
+        """
+        now = time.monotonic()
+        if not force and now - self._last_reload_check < self.config.INDEX_RELOAD_INTERVAL:
+            return
+        self._last_reload_check = now
+        version = self.indexer.versions.current_version()
+        if version is None or version in (self.index_version, self._failed_version):
+            return
+        with self._reload_lock:
+            if self._reloading:
+                return
+            self._reloading = True
+        threading.Thread(target=self._swap_index, args=(version,), name="index-swap", daemon=True).start()
+
+    def _swap_index(self, version: str) -> None:
+        """Load an index version and swap it in once ready.
+
+        The swap is aborted, keeping the current index, if either the
+        vectorstore or its BM25 retriever cannot be built.
+        """
+        try:
+            vectorstore = self.indexer.load_index(version)
+            state = IndexState(
+                vectorstore,
+                vectorstore.as_retriever(search_kwargs={"k": 3}),
+                self._build_bm25(vectorstore),
+                version
+            )
+            # In-flight queries hold a reference to the previous state
+            self._state = state
+            self._failed_version = None
+            logger.info(f"Swapped in index version {version}.")
+        except Exception as e:
+            self._failed_version = version
+            logger.error(f"Failed to swap in index version {version}: {e}")
+        finally:
+            with self._reload_lock:
+                self._reloading = False
 
     def hybrid_search(self, question: str, k: int = 3) -> List:
         """Perform hybrid search using both vector and BM25."""
-        vector_docs = self.retriever.invoke(question)
-        bm25_docs = self.bm25_retriever.invoke(question) if self.bm25_retriever else []
+        self.check_for_new_index()
+        return self._hybrid_search(self._state, question, k)
+
+    @staticmethod
+    def _hybrid_search(state: IndexState, question: str, k: int = 3) -> List:
+        """Perform hybrid search against a single index state."""
+        vector_docs = state.retriever.invoke(question)
+        bm25_docs = state.bm25_retriever.invoke(question) if state.bm25_retriever else []
         
         # Combine and deduplicate
         seen = set()
@@ -73,10 +172,12 @@ class Retriever:
             The generated answer.
         """
         # Get relevant documents
-        if use_hybrid and self.bm25_retriever:
-            docs = self.hybrid_search(question)
+        self.check_for_new_index()
+        state = self._state
+        if use_hybrid and state.bm25_retriever:
+            docs = self._hybrid_search(state, question)
         else:
-            docs = self.retriever.invoke(question)
+            docs = state.retriever.invoke(question)
         
         # Structure context with metadata
         context_parts = []
@@ -0,0 +1,100 @@
+from langchain_core.documents import Document
+from src.rag.deduplicator import Deduplicator
+
+TEXT = ("Deep evidential regression places a prior over the likelihood parameters "
+        "so that the network can estimate both aleatoric and epistemic uncertainty "
+        "from a single forward pass without sampling or ensembles.")
+
+def test_exact_duplicates_collapsed():
+    """Test that identical chunks from different files are collapsed."""
+    dedup = Deduplicator()
+    docs = [
+        Document(page_content=TEXT, metadata={"source": "a.pdf"}),
+        Document(page_content=TEXT, metadata={"source": "b.pdf"}),
+    ]
+    result = dedup.deduplicate(docs)
+    assert len(result) == 1
+    assert result[0].metadata["duplicate_sources"] == ["b.pdf"]
+    assert dedup.removed_count == 1
+
+CHUNK = (
+    "Deterministic neural networks are widely used for regression but they are notoriously "
+    "poor at expressing how uncertain they are about their own predictions. Bayesian neural "
+    "networks address this by placing priors over the weights, yet inference remains expensive "
+    "because it requires sampling many forward passes at test time. We propose an alternative "
+    "in which a higher order evidential distribution is placed over the parameters of the "
+    "Gaussian likelihood itself. Training the network to output the hyperparameters of this "
+    "distribution lets it learn both aleatoric and epistemic uncertainty without sampling, "
+    "ensembles or out of distribution examples during optimization. A regularizer penalizes "
+    "evidence on incorrect predictions so that the model becomes less confident when errors "
+    "are large. Experiments on benchmark regression tasks show calibrated uncertainty estimates "
+    "that remain competitive with strong baselines, while the approach scales to high dimensional "
+    "computer vision problems such as monocular depth estimation and robustly detects adversarial "
+    "and out of distribution inputs with little additional computational cost."
+)
+
+def _replace_words(text, positions):
+    """Replace the words at the given positions with distinct placeholders."""
+    words = text.split()
+    for i in positions:
+        words[i] = f"changed{i}"
+    return " ".join(words)
+
+def _jaccard(dedup, text_a, text_b):
+    """Exact Jaccard similarity of the shingle sets of two texts."""
+    a, b = set(dedup._shingles(text_a).tolist()), set(dedup._shingles(text_b).tolist())
+    return len(a & b) / len(a | b)
+
+def test_formatting_differences_removed():
+    """Test that chunks differing only in case and whitespace are duplicates."""
+    dedup = Deduplicator()
+    docs = [
+        Document(page_content=TEXT, metadata={"source": "a.pdf"}),
+        Document(page_content=TEXT.upper().replace(" ", "\n  "), metadata={"source": "a.pdf"}),
+    ]
+    assert len(dedup.deduplicate(docs)) == 1
+
+def test_near_duplicates_removed():
+    """Test that a chunk with a few words changed is collapsed."""
+    dedup = Deduplicator()
+    edited = _replace_words(CHUNK, [100, 101, 102])
+    assert 140 <= len(CHUNK.split()) <= 160
+    assert dedup.threshold <= _jaccard(dedup, CHUNK, edited) < 1
+    docs = [
+        Document(page_content=CHUNK, metadata={"source": "paper.pdf"}),
+        Document(page_content=edited, metadata={"source": "paper_copy.pdf"}),
+    ]
+    result = dedup.deduplicate(docs)
+    assert len(result) == 1
+    assert result[0].metadata["duplicate_sources"] == ["paper_copy.pdf"]
+
+def test_chunks_below_threshold_kept():
+    """Test that a chunk just under the similarity threshold is kept."""
+    dedup = Deduplicator()
+    edited = _replace_words(CHUNK, [30, 90, 130])
+    assert dedup.threshold - 0.05 <= _jaccard(dedup, CHUNK, edited) < dedup.threshold
+    docs = [Document(page_content=CHUNK), Document(page_content=edited)]
+    assert len(dedup.deduplicate(docs)) == 2
+
+def test_chunks_without_words_dropped():
+    """Test that punctuation-only chunks are dropped rather than collapsed together."""
+    dedup = Deduplicator()
+    docs = [
+        Document(page_content="-----"),
+        Document(page_content="...."),
+        Document(page_content=TEXT),
+        Document(page_content=TEXT),
+    ]
+    result = dedup.deduplicate(docs)
+    assert [doc.page_content for doc in result] == [TEXT]
+    assert dedup.empty_count == 2
+    assert dedup.removed_count == 1
+
+def test_distinct_chunks_kept():
+    """Test that unrelated chunks are kept in order."""
+    dedup = Deduplicator()
+    other = "The modern mathematics of deep learning studies approximation, optimization and generalization."
+    docs = [Document(page_content=TEXT), Document(page_content=other)]
+    result = dedup.deduplicate(docs)
+    assert [doc.page_content for doc in result] == [TEXT, other]
+    assert dedup.removed_count == 0
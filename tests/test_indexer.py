@@ -0,0 +1,121 @@
+import os
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock
+from src.rag import indexer as indexer_module
+from src.rag.config import Config
+from src.rag.indexer import Indexer, IndexVersions
+
+def _publish(versions):
+    version, staging_path = versions.stage()
+    with open(os.path.join(staging_path, "index.faiss"), 'w') as f:
+        f.write("index")
+    versions.publish(version, staging_path)
+    return version
+
+def test_no_current_version_falls_back_to_root(tmp_path):
+    """Test that the legacy root directory is used before any version is published."""
+    versions = IndexVersions(str(tmp_path))
+    assert versions.current_version() is None
+    assert versions.path_for(versions.current_version()) == str(tmp_path)
+
+def test_publish_updates_current_pointer(tmp_path):
+    """Test that publishing a version makes it current."""
+    versions = IndexVersions(str(tmp_path))
+    version = _publish(versions)
+    assert versions.current_version() == version
+    assert os.path.exists(os.path.join(versions.path_for(version), "index.faiss"))
+    assert versions.list_versions() == [version]
+
+def test_cleanup_keeps_recent_versions(tmp_path):
+    """Test that old versions are removed and recent ones kept."""
+    versions = IndexVersions(str(tmp_path), keep=2)
+    published = [_publish(versions) for _ in range(4)]
+    removed = versions.cleanup()
+    assert removed == published[:2]
+    assert versions.list_versions() == published[2:]
+    assert versions.current_version() == published[-1]
+
+def test_cleanup_removes_stale_staging(tmp_path):
+    """Test that abandoned staging dirs are removed but active ones are kept."""
+    versions = IndexVersions(str(tmp_path))
+    _, active_path = versions.stage()
+    stale_path = os.path.join(versions.versions_dir, f"{IndexVersions.STAGING_PREFIX}v0")
+    os.makedirs(stale_path)
+    old = time.time() - IndexVersions.STALE_STAGING_AGE - 1
+    os.utime(stale_path, (old, old))
+    os.utime(active_path, (old, old))
+    versions.cleanup()
+    assert not os.path.exists(stale_path)
+    assert os.path.exists(active_path)
+
+def test_cleanup_removes_legacy_index_after_publish(tmp_path):
+    """Test that the unversioned root index is only removed once a version exists."""
+    versions = IndexVersions(str(tmp_path))
+    for name in IndexVersions.LEGACY_FILES:
+        (tmp_path / name).write_text("legacy")
+    versions.cleanup()
+    assert all((tmp_path / name).exists() for name in IndexVersions.LEGACY_FILES)
+    _publish(versions)
+    versions.cleanup()
+    assert not any((tmp_path / name).exists() for name in IndexVersions.LEGACY_FILES)
+
+@pytest.fixture
+def indexer(tmp_path, monkeypatch):
+    """Indexer writing to a temporary directory with embeddings and FAISS mocked."""
+    monkeypatch.setattr(Config, "VECTOR_DB_PATH", str(tmp_path))
+    monkeypatch.setattr(indexer_module, "SentenceTransformerEmbeddings", MagicMock())
+    monkeypatch.setattr(indexer_module, "FAISS", MagicMock())
+    return Indexer()
+
+def test_create_index_publishes_version(indexer):
+    """Test that a successful build is published as the current version."""
+    save_local = indexer_module.FAISS.from_documents.return_value.save_local
+    save_local.side_effect = lambda path: open(os.path.join(path, "index.faiss"), 'w').close()
+    indexer.create_index([])
+    version = indexer.versions.current_version()
+    assert version is not None
+    assert os.path.exists(os.path.join(indexer.versions.path_for(version), "index.faiss"))
+
+def test_create_index_removes_staging_on_failure(indexer):
+    """Test that a failed save leaves neither a staging dir nor a new version."""
+    indexer_module.FAISS.from_documents.return_value.save_local.side_effect = OSError("disk full")
+    with pytest.raises(OSError):
+        indexer.create_index([])
+    assert os.listdir(indexer.versions.versions_dir) == []
+    assert indexer.versions.current_version() is None
+
+def test_build_index_in_background_refuses_concurrent_build(indexer, monkeypatch):
+    """Test that only one background rebuild runs at a time."""
+    started, release = threading.Event(), threading.Event()
+
+    def build_index():
+        started.set()
+        release.wait(5)
+
+    monkeypatch.setattr(indexer, "build_index", build_index)
+    thread = indexer.build_index_in_background()
+    assert thread is not None
+    assert started.wait(5)
+    assert indexer.build_index_in_background() is None
+    release.set()
+    thread.join(5)
+    assert not thread.is_alive()
+    assert indexer.build_index_in_background() is not None
+
+def test_publish_removes_version_when_pointer_update_fails(tmp_path, monkeypatch):
+    """Test that a version whose pointer update failed is not left behind."""
+    versions = IndexVersions(str(tmp_path))
+    previous = _publish(versions)
+
+    def fail_replace(src, dst):
+        raise OSError("pointer update failed")
+
+    monkeypatch.setattr(indexer_module.os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        _publish(versions)
+    assert versions.list_versions() == [previous]
+    assert versions.current_version() == previous
+    assert sorted(os.listdir(tmp_path)) == [IndexVersions.POINTER_FILE, IndexVersions.VERSIONS_DIR]
+    assert os.listdir(versions.versions_dir) == [previous]
@@ -0,0 +1,115 @@
+import pytest
+from unittest.mock import MagicMock
+from src.rag import retriever as retriever_module
+from src.rag.config import Config
+from src.rag.retriever import Retriever
+
+class SyncThread:
+    """Thread stand-in that runs its target on start."""
+
+    started = 0
+
+    def __init__(self, target, args=(), **kwargs):
+        self.target, self.args = target, args
+
+    def start(self):
+        SyncThread.started += 1
+        self.target(*self.args)
+
+def _vectorstore():
+    """Stub vectorstore with a single stored chunk."""
+    vectorstore = MagicMock()
+    vectorstore.index_to_docstore_id = {0: "doc-0"}
+    return vectorstore
+
+@pytest.fixture
+def retriever(monkeypatch):
+    """Retriever on index version v1 with the indexer, LLM and BM25 mocked."""
+    monkeypatch.setattr(Config, "GROQ_API_KEY", "test-key")
+    monkeypatch.setattr(retriever_module, "Indexer", MagicMock())
+    monkeypatch.setattr(retriever_module, "ChatOpenAI", MagicMock())
+    monkeypatch.setattr(retriever_module, "BM25Retriever", MagicMock())
+    monkeypatch.setattr(retriever_module.threading, "Thread", SyncThread)
+    SyncThread.started = 0
+    indexer = retriever_module.Indexer.return_value
+    indexer.versions.current_version.return_value = "v1"
+    indexer.load_index.side_effect = lambda version: _vectorstore()
+    return Retriever()
+
+def _publish(retriever, version):
+    retriever.indexer.versions.current_version.return_value = version
+
+def test_initial_state(retriever):
+    """Test that the initial index and BM25 retriever are loaded."""
+    assert retriever.index_version == "v1"
+    assert retriever.bm25_retriever is not None
+    retriever.vectorstore.docstore.search.assert_called_once_with("doc-0")
+
+def test_check_is_throttled(retriever):
+    """Test that checks within the reload interval are skipped unless forced."""
+    _publish(retriever, "v2")
+    retriever.check_for_new_index()
+    assert retriever.index_version == "v1"
+    retriever.check_for_new_index(force=True)
+    assert retriever.index_version == "v2"
+
+def test_check_after_interval(retriever):
+    """Test that a new version is picked up once the reload interval has passed."""
+    retriever.config.INDEX_RELOAD_INTERVAL = 0
+    _publish(retriever, "v2")
+    retriever.check_for_new_index()
+    assert retriever.index_version == "v2"
+
+def test_check_skips_unchanged_version(retriever):
+    """Test that no swap starts when the current version is already loaded."""
+    retriever.check_for_new_index(force=True)
+    assert SyncThread.started == 0
+
+def test_check_skips_while_reloading(retriever):
+    """Test that no second swap starts while one is running."""
+    _publish(retriever, "v2")
+    retriever._reloading = True
+    retriever.check_for_new_index(force=True)
+    assert SyncThread.started == 0
+    assert retriever.index_version == "v1"
+
+def test_swap_publishes_state_together(retriever):
+    """Test that the vectorstore, retrievers and version are swapped as one."""
+    old_state = retriever._state
+    retriever._swap_index("v2")
+    new_state = retriever._state
+    assert new_state is not old_state
+    assert new_state.version == "v2"
+    assert new_state.retriever is new_state.vectorstore.as_retriever.return_value
+    new_state.vectorstore.docstore.search.assert_called_once_with("doc-0")
+    assert not retriever._reloading
+
+def test_swap_aborted_when_bm25_fails(retriever):
+    """Test that a BM25 failure keeps the previous index in place."""
+    old_state = retriever._state
+    retriever_module.BM25Retriever.from_documents.side_effect = ValueError("bad docs")
+    retriever._swap_index("v2")
+    assert retriever._state is old_state
+    assert not retriever._reloading
+
+def test_swap_aborted_when_load_fails(retriever):
+    """Test that a failed index load keeps the previous index in place."""
+    old_state = retriever._state
+    retriever.indexer.load_index.side_effect = OSError("missing index")
+    retriever._swap_index("v2")
+    assert retriever._state is old_state
+    assert not retriever._reloading
+
+def test_failed_version_not_retried(retriever):
+    """Test that a version that failed to load is skipped until CURRENT changes."""
+    retriever.indexer.load_index.side_effect = OSError("corrupt index")
+    _publish(retriever, "v2")
+    retriever.check_for_new_index(force=True)
+    retriever.check_for_new_index(force=True)
+    assert SyncThread.started == 1
+    assert retriever.index_version == "v1"
+    retriever.indexer.load_index.side_effect = lambda version: _vectorstore()
+    _publish(retriever, "v3")
+    retriever.check_for_new_index(force=True)
+    assert SyncThread.started == 2
+    assert retriever.index_version == "v3"